@@ -637,10 +637,11 @@ class AdvancedGamingBot(commands.Bot):
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
         plt.xticks(rotation=45)
         
-        # Add statistics
-        avg_value = np.mean(values)
-        max_value = np.max(values)
-        min_value = np.min(values)
+        # Add statistics (convert once instead of once per reduction)
+        value_array = np.asarray(values, dtype=float)
+        avg_value = value_array.mean()
+        max_value = value_array.max()
+        min_value = value_array.min()
         
         stats_text = f'Avg: {avg_value:.1f}  Max: {max_value:.1f}  Min: {min_value:.1f}'
         ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, 
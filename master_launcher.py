@@ -498,37 +498,34 @@ class MasterLauncher:
     
     def run_interactive_mode(self):
         """Run in interactive menu mode."""
+        actions = {
+            '1': self.quick_start,
+            '2': self.configure_system,
+            '3': self.display_component_status,
+            '4': self.install_dependencies,
+            '5': self.start_all_components,
+            '6': self.open_web_dashboard,
+            '7': self.run_health_check,
+            '8': self.view_logs,
+            '9': self.backup_configuration,
+            '10': self.reset_system
+        }
+        
         while True:
             self.display_menu()
             choice = input("\n👉 Enter your choice (1-12): ").strip()
             
-            if choice == '1':
-                self.quick_start()
-            elif choice == '2':
-                self.configure_system()
-            elif choice == '3':
-                self.display_component_status()
-            elif choice == '4':
-                self.install_dependencies()
-            elif choice == '5':
-                self.start_all_components()
-            elif choice == '6':
-                self.open_web_dashboard()
-            elif choice == '7':
-                self.run_health_check()
-            elif choice == '8':
-                self.view_logs()
-            elif choice == '9':
-                self.backup_configuration()
-            elif choice == '10':
-                self.reset_system()
-            elif choice == '11':
+            if choice == '11':
                 self.shutdown()
                 break
-            elif choice == '12':
+            if choice == '12':
                 break
-            else:
+            
+            action = actions.get(choice)
+            if action is None:
                 print("❌ Invalid choice. Please try again.")
+            else:
+                action()
     
     def display_menu(self):
         """Display the main menu."""
@@ -413,11 +413,24 @@ if __name__ == "__main__":
         quick_start = '''#!/usr/bin/env python3
 """SUHA FPS+ Quick Start Script"""
 import sys
-import os
+import socket
 import time
 import subprocess
 from pathlib import Path
 
+DASHBOARD_PORT = 5000
+
+def wait_for_port(port: int, process: subprocess.Popen, timeout: float = 5.0) -> bool:
+    """Poll until something accepts connections on the port, or give up."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and process.poll() is None:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.05):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
 def main():
     print("""
 ╔══════════════════════════════════════════════════════════════════════════╗
@@ -429,7 +442,8 @@ def main():
     print("🚀 Starting SUHA FPS+ v4.0...")
     
     # Check if we're in the right directory
-    if not Path("master_launcher.py").exists():
+    launcher = Path("master_launcher.py").resolve()
+    if not launcher.exists():
         print("❌ master_launcher.py not found. Please run from the project directory.")
         return False
     
@@ -444,19 +458,28 @@ def main():
     print("2. Starting web dashboard...")
     try:
         # Start web dashboard in background
-        subprocess.Popen([sys.executable, "web_dashboard.py"], 
-                        stdout=subprocess.DEVNULL, 
-                        stderr=subprocess.DEVNULL)
-        time.sleep(2)
-        print("   ✅ Web dashboard started on http://localhost:5000")
+        dashboard = subprocess.Popen([sys.executable, "web_dashboard.py"], 
+                                     stdout=subprocess.DEVNULL, 
+                                     stderr=subprocess.DEVNULL)
+        if wait_for_port(DASHBOARD_PORT, dashboard):
+            print(f"   ✅ Web dashboard started on http://localhost:{DASHBOARD_PORT}")
+        elif dashboard.poll() is not None:
+            print(f"   ⚠️  Web dashboard exited with code {dashboard.returncode}")
+        else:
+            print(f"   ⚠️  Web dashboard is still starting on http://localhost:{DASHBOARD_PORT}")
     except Exception as e:
         print(f"   ⚠️  Web dashboard failed: {e}")
     
     print("3. Starting master launcher...")
     try:
-        os.system(f"{sys.executable} master_launcher.py")
-    except KeyboardInterrupt:
-        print("\\n🛑 Shutting down...")
+        launcher_process = subprocess.Popen([sys.executable, str(launcher)])
+        while True:
+            try:
+                launcher_process.wait()
+                break
+            except KeyboardInterrupt:
+                # Ctrl+C reaches the launcher too; let its shutdown() stop the components
+                print("\\n🛑 Shutting down...")
     except Exception as e:
         print(f"   ❌ Master launcher failed: {e}")
     
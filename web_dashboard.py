@@ -11,7 +11,7 @@ import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 # Try to import required packages
 try:
@@ -29,12 +29,38 @@ except ImportError as e:
 class SystemMonitor:
     """Real-time system monitoring."""
     
+    # The neural interface emits request_status every 1000 ms and the background
+    # loop runs every 5 s; stay under the client interval so every poll still
+    # sees fresh numbers while concurrent callers share one psutil sweep
+    METRICS_CACHE_TTL = 0.9  # seconds
+    
     def __init__(self):
         self.last_cpu_times = psutil.cpu_times()
         self.last_check_time = time.time()
+        self._metrics_cache: Dict[bool, Tuple[float, Dict[str, Any]]] = {}
+        self._metrics_lock = threading.Lock()
+        
+    def get_system_metrics(self, include_details: bool = True) -> Dict[str, Any]:
+        """Get comprehensive system metrics (cached briefly).
         
-    def get_system_metrics(self) -> Dict[str, Any]:
-        """Get comprehensive system metrics."""
+        Callers that only need CPU, memory and temperature can pass
+        include_details=False to skip the network counters and process scan.
+        """
+        with self._metrics_lock:
+            now = time.monotonic()
+            # A detailed snapshot also satisfies a summary request
+            for detailed in ((True,) if include_details else (True, False)):
+                cached = self._metrics_cache.get(detailed)
+                if cached and now - cached[0] < self.METRICS_CACHE_TTL:
+                    return cached[1]
+            
+            metrics = self._collect_system_metrics(include_details)
+            if 'error' not in metrics:
+                self._metrics_cache[include_details] = (now, metrics)
+            return metrics
+    
+    def _collect_system_metrics(self, include_details: bool) -> Dict[str, Any]:
+        """Collect system metrics from psutil."""
         try:
             # CPU metrics
             cpu_usage = psutil.cpu_percent(interval=0.1)
@@ -48,9 +74,6 @@ class SystemMonitor:
             # Disk metrics
             disk_usage = psutil.disk_usage('/')
             
-            # Network metrics
-            network = psutil.net_io_counters()
-            
             # Temperature (if available)
             temperature = None
             try:
@@ -64,21 +87,7 @@ class SystemMonitor:
             except (AttributeError, OSError):
                 temperature = 0
             
-            # Process information
-            python_processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-                try:
-                    if 'python' in proc.info['name'].lower():
-                        python_processes.append({
-                            'pid': proc.info['pid'],
-                            'name': proc.info['name'],
-                            'cpu_percent': proc.info['cpu_percent'] or 0,
-                            'memory_percent': proc.info['memory_percent'] or 0
-                        })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-            
-            return {
+            metrics = {
                 'timestamp': datetime.now().isoformat(),
                 'cpu': {
                     'usage_percent': cpu_usage,
@@ -103,16 +112,40 @@ class SystemMonitor:
                     'free_gb': disk_usage.free / (1024**3),
                     'used_gb': disk_usage.used / (1024**3)
                 },
+                'temperature': temperature or 0
+            }
+            
+            if not include_details:
+                return metrics
+            
+            # Network metrics
+            network = psutil.net_io_counters()
+            
+            # Process information
+            python_processes = []
+            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+                try:
+                    if 'python' in proc.info['name'].lower():
+                        python_processes.append({
+                            'pid': proc.info['pid'],
+                            'name': proc.info['name'],
+                            'cpu_percent': proc.info['cpu_percent'] or 0,
+                            'memory_percent': proc.info['memory_percent'] or 0
+                        })
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+            
+            metrics.update({
                 'network': {
                     'bytes_sent': network.bytes_sent,
                     'bytes_recv': network.bytes_recv,
                     'packets_sent': network.packets_sent,
                     'packets_recv': network.packets_recv
                 },
-                'temperature': temperature or 0,
                 'python_processes': python_processes,
                 'process_count': len(python_processes)
-            }
+            })
+            return metrics
             
         except Exception as e:
             print(f"Error getting system metrics: {e}")
@@ -124,7 +157,10 @@ class SystemMonitor:
 class ComponentManager:
     """Manages component status and control."""
     
+    STATUS_CACHE_TTL = 2.0  # seconds
+    
     def __init__(self):
+        self.last_update_time = 0.0
         self.components = {
             'ai_engine': {'running': False, 'pid': None, 'health': 'unknown'},
             'performance_optimizer': {'running': False, 'pid': None, 'health': 'unknown'},
@@ -177,13 +213,16 @@ class ComponentManager:
                     'pid': pid,
                     'health': 'healthy' if running else 'stopped'
                 })
+            
+            self.last_update_time = time.monotonic()
                 
         except Exception as e:
             print(f"Error updating component status: {e}")
     
     def get_component_status(self) -> Dict[str, Any]:
-        """Get current component status."""
-        self.update_component_status()
+        """Get current component status, rescanning processes only when stale."""
+        if time.monotonic() - self.last_update_time >= self.STATUS_CACHE_TTL:
+            self.update_component_status()
         return self.components.copy()
 
 # Create Flask app
@@ -360,7 +399,7 @@ def api_ai_analyze():
     add_log("AI analysis requested via API", "info")
     
     # Mock AI analysis response
-    metrics = system_monitor.get_system_metrics()
+    metrics = system_monitor.get_system_metrics(include_details=False)
     cpu_usage = metrics['cpu']['usage_percent']
     memory_usage = metrics['memory']['usage_percent']
     
@@ -433,7 +472,7 @@ def handle_disconnect():
 def handle_status_request():
     """Handle status update requests."""
     try:
-        system_metrics = system_monitor.get_system_metrics()
+        system_metrics = system_monitor.get_system_metrics(include_details=False)
         component_status = component_manager.get_component_status()
         
         # Format data for frontend
@@ -455,11 +494,8 @@ def background_monitoring():
     """Background thread for continuous monitoring."""
     while True:
         try:
-            # Update component status every 5 seconds
-            component_manager.update_component_status()
-            
             # Emit periodic status updates
-            system_metrics = system_monitor.get_system_metrics()
+            system_metrics = system_monitor.get_system_metrics(include_details=False)
             component_status = component_manager.get_component_status()
             
             dashboard_data = {
@@ -2,27 +2,55 @@
 """
 Windows 11/10 Advanced Gaming Optimizer v4.0
 Cutting-edge optimizations for Windows 10/11 gaming performance with hardware-specific enhancements.
+
+Delayed ACKs and Nagle are disabled per socket where the optimizer controls the
+socket (see create_latency_socket and NetworkOptimizations.disable_delayed_ack).
+Windows has no global Nagle switch, so only the per-interface TcpAckFrequency
+registry value is written as a fallback for other apps.
 """
 
 import ctypes
-import winreg
 import subprocess
 import os
+import re
+import socket
+import tempfile
 import threading
 import time
 import json
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
+from contextlib import contextmanager
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
 
+try:
+    import winreg
+    HAS_WINREG = True
+except ImportError:
+    HAS_WINREG = False
+
 try:
     import wmi
     HAS_WMI = True
 except ImportError:
     HAS_WMI = False
 
+# Loaded once: disable_delayed_ack runs for every socket create_latency_socket opens
+try:
+    _ws2_32 = ctypes.WinDLL("ws2_32", use_last_error=True)
+    _ws2_32.WSAIoctl.argtypes = [
+        ctypes.c_size_t,  # SOCKET is pointer-sized
+        ctypes.c_ulong, ctypes.c_void_p, ctypes.c_ulong, ctypes.c_void_p, ctypes.c_ulong,
+        ctypes.POINTER(ctypes.c_ulong), ctypes.c_void_p, ctypes.c_void_p
+    ]
+    _ws2_32.WSAIoctl.restype = ctypes.c_int
+except (AttributeError, OSError):
+    _ws2_32 = None
+
 @dataclass
 class SystemInfo:
     """System information for optimization targeting."""
@@ -36,6 +64,150 @@ class SystemInfo:
     has_game_mode: bool
     has_hags: bool  # Hardware Accelerated GPU Scheduling
 
+@dataclass(frozen=True)
+class DNSConfig:
+    """A public DNS provider's server pair."""
+    name: str
+    primary: str
+    secondary: str
+
+GAMING_DNS = DNSConfig("Cloudflare", "1.1.1.1", "1.0.0.1")
+
+def _import_registry_values(sections: Dict[str, Dict[str, int]]) -> subprocess.CompletedProcess:
+    """Write DWORD values for several keys with a single `reg import`.
+    
+    `sections` maps full key paths (including the hive name) to the
+    values that should be set under them.
+    """
+    lines = ["Windows Registry Editor Version 5.00", ""]
+    for key_path, values in sections.items():
+        lines.append(f"[{key_path}]")
+        for name, value in values.items():
+            lines.append(f'"{name}"=dword:{value:08x}')
+        lines.append("")
+    
+    with tempfile.NamedTemporaryFile("w", suffix=".reg", encoding="utf-16",
+                                     newline="\r\n", delete=False) as reg_file:
+        reg_file.write("\n".join(lines))
+        reg_path = reg_file.name
+    
+    try:
+        return subprocess.run(["reg", "import", reg_path], capture_output=True, text=True, timeout=30)
+    finally:
+        os.unlink(reg_path)
+
+BATCH_SENTINEL = "::CMD_OK::"
+
+def _run_command_batch(commands: List[Tuple[str, List[str]]], timeout: float = 60) -> Dict[str, bool]:
+    """Run several commands in one cmd.exe session and report which ones succeeded.
+    
+    Each command is followed by an echoed sentinel that only prints when it
+    exits cleanly, so per-command results survive the batching.
+    """
+    script = " & ".join(
+        f"{subprocess.list2cmdline(command)} && echo {BATCH_SENTINEL}{tag}" for tag, command in commands
+    )
+    result = subprocess.run(["cmd", "/c", script], stdin=subprocess.DEVNULL,
+                            capture_output=True, text=True, timeout=timeout)
+    succeeded = {
+        line.strip()[len(BATCH_SENTINEL):] for line in result.stdout.splitlines()
+        if line.strip().startswith(BATCH_SENTINEL)
+    }
+    return {tag: tag in succeeded for tag, _ in commands}
+
+def _record_result(results: Dict[str, Any], outcome: Any, category: str):
+    """Add one step's result (or the exception it raised) to a category tally."""
+    if isinstance(outcome, Exception):
+        logging.getLogger(__name__).error(f"{category} optimization failed: {outcome}")
+        results["failed"] += 1
+        return
+    
+    results["optimizations"].append(outcome)
+    results["total"] += 1
+    if outcome.get("success", False):
+        results["successful"] += 1
+    else:
+        results["failed"] += 1
+
+async def _run_optimization_steps(steps: List[Callable[[], Awaitable[Dict[str, Any]]]], category: str,
+                                  concurrent: bool = False) -> Dict[str, Any]:
+    """Run a category's optimization steps and tally their results."""
+    results = {
+        "status": "success",
+        "total": 0,
+        "successful": 0,
+        "failed": 0,
+        "optimizations": []
+    }
+    
+    if concurrent:
+        outcomes = await asyncio.gather(*(step() for step in steps), return_exceptions=True)
+    else:
+        outcomes = []
+        for step in steps:
+            try:
+                outcomes.append(await step())
+            except Exception as e:
+                outcomes.append(e)
+    
+    for outcome in outcomes:
+        _record_result(results, outcome, category)
+    return results
+
+async def _run_command(command: List[str], timeout: float = 15) -> int:
+    """Run a command without blocking the event loop and return its exit code."""
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        return await asyncio.wait_for(process.wait(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        # Reap the child so its transport is closed before the loop shuts down
+        await process.wait()
+        raise TimeoutError(f"{command[0]} did not finish within {timeout:g}s") from None
+
+class RegistryKeyCache:
+    """Shares open registry key handles between optimizations.
+    
+    Several tweaks write to the same keys; routing them through this cache
+    opens each key once per run instead of once per tweak. Keys are always
+    opened in the 64-bit view so 32-bit Python is not redirected to
+    Wow6432Node.
+    """
+    
+    def __init__(self):
+        self._hives: Dict[int, Any] = {}
+        self._handles: Dict[Tuple[int, str, int], Any] = {}
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def open(self, hive: int, path: str, access: Optional[int] = None):
+        """Yield a handle for the key, opening it on first use (write access by default)."""
+        if access is None:
+            access = winreg.KEY_SET_VALUE
+        cache_key = (hive, path, access)
+        with self._lock:
+            handle = self._handles.get(cache_key)
+            if handle is None:
+                root = self._hives.get(hive)
+                if root is None:
+                    root = self._hives[hive] = winreg.ConnectRegistry(None, hive)
+                handle = winreg.OpenKey(root, path, 0, access | winreg.KEY_WOW64_64KEY)
+                self._handles[cache_key] = handle
+        yield handle
+    
+    def close_all(self):
+        """Close every cached key and hive handle."""
+        with self._lock:
+            for handle in self._handles.values():
+                handle.Close()
+            for root in self._hives.values():
+                root.Close()
+            self._handles.clear()
+            self._hives.clear()
+
 class Windows11GamingOptimizer:
     """Advanced Windows 11/10 gaming optimizations."""
     
@@ -44,15 +216,35 @@ class Windows11GamingOptimizer:
         self.is_admin = self._check_admin_privileges()
         self.system_info = self._gather_system_info()
         self.optimization_history = []
-        
-        # Optimization categories
-        self.cpu_optimizations = CPUOptimizations()
-        self.memory_optimizations = MemoryOptimizations()
-        self.gpu_optimizations = GPUOptimizations()
-        self.network_optimizations = NetworkOptimizations()
-        self.storage_optimizations = StorageOptimizations()
-        self.gaming_optimizations = GamingModeOptimizations()
-        
+        self.registry_keys = RegistryKeyCache()
+        self._apply_lock = threading.Lock()
+    
+    # Optimization categories are built on first use, so an optimizer that is
+    # only asked for system info or recommendations never loads them
+    @cached_property
+    def cpu_optimizations(self) -> "CPUOptimizations":
+        return CPUOptimizations(self.registry_keys)
+    
+    @cached_property
+    def memory_optimizations(self) -> "MemoryOptimizations":
+        return MemoryOptimizations(self.registry_keys)
+    
+    @cached_property
+    def gpu_optimizations(self) -> "GPUOptimizations":
+        return GPUOptimizations(self.registry_keys)
+    
+    @cached_property
+    def network_optimizations(self) -> "NetworkOptimizations":
+        return NetworkOptimizations(self.registry_keys)
+    
+    @cached_property
+    def storage_optimizations(self) -> "StorageOptimizations":
+        return StorageOptimizations(self.registry_keys)
+    
+    @cached_property
+    def gaming_optimizations(self) -> "GamingModeOptimizations":
+        return GamingModeOptimizations(self.registry_keys)
+    
     def _check_admin_privileges(self) -> bool:
         """Check if running with administrator privileges."""
         try:
@@ -100,10 +292,25 @@ class Windows11GamingOptimizer:
     
     async def apply_all_optimizations(self) -> Dict[str, Any]:
         """Apply all available optimizations."""
+        if not HAS_WINREG:
+            self.logger.error("Windows registry access is not available on this platform")
+            return {"status": "error", "message": "Windows registry access not available"}
+        
         if not self.is_admin:
             self.logger.error("Administrator privileges required for optimizations")
             return {"status": "error", "message": "Administrator privileges required"}
         
+        # Launcher commands can fire twice; a second pass would only fight the first
+        if not self._apply_lock.acquire(blocking=False):
+            self.logger.warning("Optimizations are already being applied")
+            return {"status": "error", "message": "Optimizations already in progress"}
+        try:
+            return await self._apply_categories()
+        finally:
+            self._apply_lock.release()
+    
+    async def _apply_categories(self) -> Dict[str, Any]:
+        """Run every optimization category and merge their results."""
         results = {
             "timestamp": time.time(),
             "total_optimizations": 0,
@@ -112,25 +319,45 @@ class Windows11GamingOptimizer:
             "categories": {}
         }
         
-        optimization_tasks = [
-            ("cpu", self.cpu_optimizations.apply_optimizations()),
-            ("memory", self.memory_optimizations.apply_optimizations()),
-            ("gpu", self.gpu_optimizations.apply_optimizations()),
-            ("network", self.network_optimizations.apply_optimizations()),
-            ("storage", self.storage_optimizations.apply_optimizations()),
-            ("gaming", self.gaming_optimizations.apply_optimizations())
+        # Categories touch independent settings, and their coroutines spend nearly
+        # all their time in blocking subprocess.run and winreg calls rather than
+        # awaiting anything. Each one therefore gets its own event loop on a
+        # worker thread so those blocking calls overlap. The CPU category is the
+        # only one that switches the active power plan, and it does so before
+        # tuning scheme_current, so its processor settings land on the plan that
+        # stays active.
+        parallel_categories = [
+            ("cpu", self.cpu_optimizations.apply_optimizations),
+            ("memory", self.memory_optimizations.apply_optimizations),
+            ("gpu", self.gpu_optimizations.apply_optimizations),
+            ("network", self.network_optimizations.apply_optimizations),
+            ("storage", self.storage_optimizations.apply_optimizations),
+            ("gaming", self.gaming_optimizations.apply_optimizations)
         ]
         
-        for category, task in optimization_tasks:
-            try:
-                category_result = await task
-                results["categories"][category] = category_result
-                results["total_optimizations"] += category_result.get("total", 0)
-                results["successful_optimizations"] += category_result.get("successful", 0)
-                results["failed_optimizations"] += category_result.get("failed", 0)
-            except Exception as e:
-                self.logger.error(f"Failed to apply {category} optimizations: {e}")
-                results["categories"][category] = {"status": "error", "message": str(e)}
+        loop = asyncio.get_running_loop()
+        try:
+            with ThreadPoolExecutor(max_workers=len(parallel_categories)) as executor:
+                category_outcomes = await asyncio.gather(
+                    *(loop.run_in_executor(executor, asyncio.run, apply()) for _, apply in parallel_categories),
+                    return_exceptions=True
+                )
+        finally:
+            # Keys are shared across categories, so release them once all are done
+            self.registry_keys.close_all()
+        
+        categories = [category for category, _ in parallel_categories]
+        
+        for category, category_result in zip(categories, category_outcomes):
+            if isinstance(category_result, Exception):
+                self.logger.error(f"Failed to apply {category} optimizations: {category_result}")
+                results["categories"][category] = {"status": "error", "message": str(category_result)}
+                continue
+            
+            results["categories"][category] = category_result
+            results["total_optimizations"] += category_result.get("total", 0)
+            results["successful_optimizations"] += category_result.get("successful", 0)
+            results["failed_optimizations"] += category_result.get("failed", 0)
         
         self.optimization_history.append(results)
         return results
@@ -206,89 +433,93 @@ class Windows11GamingOptimizer:
 class CPUOptimizations:
     """Advanced CPU optimization techniques."""
     
-    def __init__(self):
+    HIGH_PERFORMANCE_SCHEME = "8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c"
+    ULTIMATE_PERFORMANCE_SCHEME = "e9a42b02-d5df-448d-aa00-03f14749eb61"
+    PROCESSOR_SUBGROUP = "54533251-82be-4824-96c1-47b60b740d00"
+    # (result name, power setting GUID, AC value, success message); one entry
+    # per GUID, since a later write to the same setting silently replaces it.
+    # Processor performance boost mode is an index (0-6), not a percentage:
+    # 1 = Enabled
+    POWER_SETTINGS = (
+        ("CPU Parking Disable", "0cc5b647-c1df-4637-891a-dec35c318583", "100", "CPU parking disabled for all cores"),
+        ("Turbo Boost Enable", "be337238-0d82-4146-a960-4f3749d470c7", "1", "CPU Turbo Boost enabled"),
+        ("Minimum Processor State", "893dee8e-2bef-41e0-89c6-b55d0929964c", "100", "Minimum processor state set to 100%")
+    )
+    
+    def __init__(self, registry_keys: Optional[RegistryKeyCache] = None):
         self.logger = logging.getLogger(__name__)
+        self.registry_keys = registry_keys or RegistryKeyCache()
     
     async def apply_optimizations(self) -> Dict[str, Any]:
         """Apply CPU optimizations."""
-        results = {
-            "status": "success",
-            "total": 0,
-            "successful": 0,
-            "failed": 0,
-            "optimizations": []
-        }
-        
         optimizations = [
             self._set_high_performance_power_plan,
-            self._disable_cpu_parking,
             self._optimize_interrupt_policy,
             self._set_processor_scheduling,
-            self._disable_cpu_throttling,
-            self._optimize_core_affinity,
-            self._enable_turbo_boost,
-            self._set_minimum_processor_state
+            self._optimize_core_affinity
         ]
         
-        for optimization in optimizations:
-            try:
-                result = await optimization()
-                results["optimizations"].append(result)
-                results["total"] += 1
-                if result.get("success", False):
-                    results["successful"] += 1
-                else:
-                    results["failed"] += 1
-            except Exception as e:
-                self.logger.error(f"CPU optimization failed: {e}")
-                results["failed"] += 1
+        results = await _run_optimization_steps(optimizations, "CPU")
+        
+        # The powercfg settings share a single process instead of one each
+        for result in self._apply_power_settings():
+            _record_result(results, result, "CPU")
         
         return results
     
     async def _set_high_performance_power_plan(self) -> Dict[str, Any]:
-        """Set high performance power plan."""
+        """Activate Ultimate Performance, or High Performance where it is unavailable."""
         try:
-            # Set high performance power plan
+            # This is the only step that switches plans, so POWER_SETTINGS below
+            # tune the scheme that stays active
             result = subprocess.run([
-                "powercfg", "/setactive", "8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c"
+                "powercfg", "/duplicatescheme", self.ULTIMATE_PERFORMANCE_SCHEME
             ], capture_output=True, text=True)
+            match = re.search(r"GUID:\s*([0-9a-fA-F-]{36})", result.stdout) if result.returncode == 0 else None
+            if match:
+                plan, scheme = "Ultimate Performance", match.group(1)
+            else:
+                plan, scheme = "High Performance", self.HIGH_PERFORMANCE_SCHEME
+            
+            result = subprocess.run(["powercfg", "/setactive", scheme], capture_output=True, text=True)
             
             return {
                 "name": "High Performance Power Plan",
                 "success": result.returncode == 0,
-                "message": "Activated high performance power plan" if result.returncode == 0 else result.stderr
+                "message": f"Activated {plan.lower()} power plan" if result.returncode == 0 else result.stderr
             }
         except Exception as e:
             return {"name": "High Performance Power Plan", "success": False, "message": str(e)}
     
-    async def _disable_cpu_parking(self) -> Dict[str, Any]:
-        """Disable CPU parking for all cores."""
+    def _apply_power_settings(self) -> List[Dict[str, Any]]:
+        """Write every processor power setting and re-apply the scheme in one batch."""
+        commands = [
+            (name, ["powercfg", "/setacvalueindex", "scheme_current", self.PROCESSOR_SUBGROUP, setting, value])
+            for name, setting, value, _ in self.POWER_SETTINGS
+        ]
+        # Activate last so all of the values above take effect together
+        commands.append(("activate", ["powercfg", "/setactive", "scheme_current"]))
+        
         try:
-            # Disable CPU parking
-            subprocess.run([
-                "powercfg", "/setacvalueindex", "scheme_current",
-                "54533251-82be-4824-96c1-47b60b740d00",
-                "0cc5b647-c1df-4637-891a-dec35c318583", "100"
-            ], check=True)
-            
-            # Apply settings
-            subprocess.run(["powercfg", "/setactive", "scheme_current"], check=True)
-            
-            return {
-                "name": "CPU Parking Disable",
-                "success": True,
-                "message": "CPU parking disabled for all cores"
-            }
+            succeeded = _run_command_batch(commands)
         except Exception as e:
-            return {"name": "CPU Parking Disable", "success": False, "message": str(e)}
+            return [{"name": name, "success": False, "message": str(e)} for name, _, _, _ in self.POWER_SETTINGS]
+        
+        results = []
+        for name, _, _, message in self.POWER_SETTINGS:
+            if not succeeded[name]:
+                message = f"powercfg could not write {name.lower()}"
+            elif not succeeded["activate"]:
+                message = "powercfg could not re-apply the current scheme"
+            results.append({"name": name, "success": succeeded[name] and succeeded["activate"], "message": message})
+        return results
     
     async def _optimize_interrupt_policy(self) -> Dict[str, Any]:
         """Optimize interrupt handling policy."""
         try:
             # Set interrupt policy for gaming
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
-                              r"SYSTEM\CurrentControlSet\Control\PriorityControl",
-                              0, winreg.KEY_SET_VALUE) as key:
+            with self.registry_keys.open(winreg.HKEY_LOCAL_MACHINE,
+                                         r"SYSTEM\CurrentControlSet\Control\PriorityControl") as key:
                 winreg.SetValueEx(key, "IRQ8Priority", 0, winreg.REG_DWORD, 1)
                 winreg.SetValueEx(key, "IRQ16Priority", 0, winreg.REG_DWORD, 2)
             
@@ -303,9 +534,8 @@ class CPUOptimizations:
     async def _set_processor_scheduling(self) -> Dict[str, Any]:
         """Set processor scheduling for programs priority."""
         try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
-                              r"SYSTEM\CurrentControlSet\Control\PriorityControl",
-                              0, winreg.KEY_SET_VALUE) as key:
+            with self.registry_keys.open(winreg.HKEY_LOCAL_MACHINE,
+                                         r"SYSTEM\CurrentControlSet\Control\PriorityControl") as key:
                 # Optimize for programs (not background services)
                 winreg.SetValueEx(key, "Win32PrioritySeparation", 0, winreg.REG_DWORD, 38)
             
@@ -317,24 +547,6 @@ class CPUOptimizations:
         except Exception as e:
             return {"name": "Processor Scheduling", "success": False, "message": str(e)}
     
-    async def _disable_cpu_throttling(self) -> Dict[str, Any]:
-        """Disable CPU throttling."""
-        try:
-            # Disable CPU throttling
-            subprocess.run([
-                "powercfg", "/setacvalueindex", "scheme_current",
-                "54533251-82be-4824-96c1-47b60b740d00",
-                "be337238-0d82-4146-a960-4f3749d470c7", "0"
-            ], check=True)
-            
-            return {
-                "name": "CPU Throttling Disable",
-                "success": True,
-                "message": "CPU throttling disabled"
-            }
-        except Exception as e:
-            return {"name": "CPU Throttling Disable", "success": False, "message": str(e)}
-    
     async def _optimize_core_affinity(self) -> Dict[str, Any]:
         """Optimize core affinity for gaming."""
         try:
@@ -348,58 +560,15 @@ class CPUOptimizations:
         except Exception as e:
             return {"name": "Core Affinity Optimization", "success": False, "message": str(e)}
     
-    async def _enable_turbo_boost(self) -> Dict[str, Any]:
-        """Enable CPU Turbo Boost."""
-        try:
-            # Enable Turbo Boost
-            subprocess.run([
-                "powercfg", "/setacvalueindex", "scheme_current",
-                "54533251-82be-4824-96c1-47b60b740d00",
-                "be337238-0d82-4146-a960-4f3749d470c7", "100"
-            ], check=True)
-            
-            return {
-                "name": "Turbo Boost Enable",
-                "success": True,
-                "message": "CPU Turbo Boost enabled"
-            }
-        except Exception as e:
-            return {"name": "Turbo Boost Enable", "success": False, "message": str(e)}
-    
-    async def _set_minimum_processor_state(self) -> Dict[str, Any]:
-        """Set minimum processor state to 100%."""
-        try:
-            # Set minimum processor state
-            subprocess.run([
-                "powercfg", "/setacvalueindex", "scheme_current",
-                "54533251-82be-4824-96c1-47b60b740d00",
-                "893dee8e-2bef-41e0-89c6-b55d0929964c", "100"
-            ], check=True)
-            
-            return {
-                "name": "Minimum Processor State",
-                "success": True,
-                "message": "Minimum processor state set to 100%"
-            }
-        except Exception as e:
-            return {"name": "Minimum Processor State", "success": False, "message": str(e)}
-
 class MemoryOptimizations:
     """Advanced memory optimization techniques."""
     
-    def __init__(self):
+    def __init__(self, registry_keys: Optional[RegistryKeyCache] = None):
         self.logger = logging.getLogger(__name__)
+        self.registry_keys = registry_keys or RegistryKeyCache()
     
     async def apply_optimizations(self) -> Dict[str, Any]:
         """Apply memory optimizations."""
-        results = {
-            "status": "success",
-            "total": 0,
-            "successful": 0,
-            "failed": 0,
-            "optimizations": []
-        }
-        
         optimizations = [
             self._disable_memory_compression,
             self._optimize_virtual_memory,
@@ -410,20 +579,7 @@ class MemoryOptimizations:
             self._optimize_working_set
         ]
         
-        for optimization in optimizations:
-            try:
-                result = await optimization()
-                results["optimizations"].append(result)
-                results["total"] += 1
-                if result.get("success", False):
-                    results["successful"] += 1
-                else:
-                    results["failed"] += 1
-            except Exception as e:
-                self.logger.error(f"Memory optimization failed: {e}")
-                results["failed"] += 1
-        
-        return results
+        return await _run_optimization_steps(optimizations, "Memory")
     
     async def _disable_memory_compression(self) -> Dict[str, Any]:
         """Disable memory compression for better gaming performance."""
@@ -445,12 +601,18 @@ class MemoryOptimizations:
     async def _optimize_virtual_memory(self) -> Dict[str, Any]:
         """Optimize virtual memory settings."""
         try:
-            # Set virtual memory to system managed or custom size
-            # This is typically done through WMI for programmatic access
+            # A system-managed page file on the system drive. Win32_PageFileSetting
+            # only fronts this MULTI_SZ ("<path> <initial MB> <max MB>", 0 0 meaning
+            # system managed), so write it directly instead of starting WMI/COM.
+            system_drive = os.environ.get("SystemDrive", "C:")
+            with self.registry_keys.open(winreg.HKEY_LOCAL_MACHINE,
+                                         r"SYSTEM\CurrentControlSet\Control\Session Manager\Memory Management") as key:
+                winreg.SetValueEx(key, "PagingFiles", 0, winreg.REG_MULTI_SZ, [f"{system_drive}\\pagefile.sys 0 0"])
+            
             return {
                 "name": "Virtual Memory Optimization",
                 "success": True,
-                "message": "Virtual memory settings optimized"
+                "message": "Page file set to system managed (restart required)"
             }
         except Exception as e:
             return {"name": "Virtual Memory Optimization", "success": False, "message": str(e)}
@@ -458,9 +620,8 @@ class MemoryOptimizations:
     async def _set_large_system_cache(self) -> Dict[str, Any]:
         """Set large system cache for better performance."""
         try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
-                              r"SYSTEM\CurrentControlSet\Control\Session Manager\Memory Management",
-                              0, winreg.KEY_SET_VALUE) as key:
+            with self.registry_keys.open(winreg.HKEY_LOCAL_MACHINE,
+                                         r"SYSTEM\CurrentControlSet\Control\Session Manager\Memory Management") as key:
                 winreg.SetValueEx(key, "LargeSystemCache", 0, winreg.REG_DWORD, 1)
             
             return {
@@ -474,9 +635,8 @@ class MemoryOptimizations:
     async def _disable_prefetch(self) -> Dict[str, Any]:
         """Disable prefetch for SSD optimization."""
         try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
-                              r"SYSTEM\CurrentControlSet\Control\Session Manager\Memory Management\PrefetchParameters",
-                              0, winreg.KEY_SET_VALUE) as key:
+            with self.registry_keys.open(winreg.HKEY_LOCAL_MACHINE,
+                                         r"SYSTEM\CurrentControlSet\Control\Session Manager\Memory Management\PrefetchParameters") as key:
                 winreg.SetValueEx(key, "EnablePrefetcher", 0, winreg.REG_DWORD, 0)
                 winreg.SetValueEx(key, "EnableSuperfetch", 0, winreg.REG_DWORD, 0)
             
@@ -491,9 +651,8 @@ class MemoryOptimizations:
     async def _optimize_heap_management(self) -> Dict[str, Any]:
         """Optimize heap management settings."""
         try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
-                              r"SYSTEM\CurrentControlSet\Control\Session Manager",
-                              0, winreg.KEY_SET_VALUE) as key:
+            with self.registry_keys.open(winreg.HKEY_LOCAL_MACHINE,
+                                         r"SYSTEM\CurrentControlSet\Control\Session Manager") as key:
                 winreg.SetValueEx(key, "HeapDeCommitFreeBlockThreshold", 0, winreg.REG_DWORD, 0x40000)
                 winreg.SetValueEx(key, "HeapDeCommitTotalFreeThreshold", 0, winreg.REG_DWORD, 0x100000)
             
@@ -509,10 +668,10 @@ class MemoryOptimizations:
         """Disable memory integrity for gaming performance."""
         try:
             # Disable Core Isolation Memory Integrity
-            result = subprocess.run([
+            subprocess.run([
                 "powershell", "-Command",
                 "Set-ProcessMitigation -System -Disable CFG"
-            ], capture_output=True, text=True)
+            ], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             return {
                 "name": "Memory Integrity Disable",
@@ -525,9 +684,8 @@ class MemoryOptimizations:
     async def _optimize_working_set(self) -> Dict[str, Any]:
         """Optimize working set parameters."""
         try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
-                              r"SYSTEM\CurrentControlSet\Control\Session Manager\Memory Management",
-                              0, winreg.KEY_SET_VALUE) as key:
+            with self.registry_keys.open(winreg.HKEY_LOCAL_MACHINE,
+                                         r"SYSTEM\CurrentControlSet\Control\Session Manager\Memory Management") as key:
                 winreg.SetValueEx(key, "DisablePagingExecutive", 0, winreg.REG_DWORD, 1)
                 winreg.SetValueEx(key, "ClearPageFileAtShutdown", 0, winreg.REG_DWORD, 0)
             
@@ -542,19 +700,12 @@ class MemoryOptimizations:
 class GPUOptimizations:
     """Advanced GPU optimization techniques."""
     
-    def __init__(self):
+    def __init__(self, registry_keys: Optional[RegistryKeyCache] = None):
         self.logger = logging.getLogger(__name__)
+        self.registry_keys = registry_keys or RegistryKeyCache()
     
     async def apply_optimizations(self) -> Dict[str, Any]:
         """Apply GPU optimizations."""
-        results = {
-            "status": "success",
-            "total": 0,
-            "successful": 0,
-            "failed": 0,
-            "optimizations": []
-        }
-        
         optimizations = [
             self._enable_hardware_gpu_scheduling,
             self._disable_fullscreen_optimization,
@@ -565,27 +716,13 @@ class GPUOptimizations:
             self._set_variable_refresh_rate
         ]
         
-        for optimization in optimizations:
-            try:
-                result = await optimization()
-                results["optimizations"].append(result)
-                results["total"] += 1
-                if result.get("success", False):
-                    results["successful"] += 1
-                else:
-                    results["failed"] += 1
-            except Exception as e:
-                self.logger.error(f"GPU optimization failed: {e}")
-                results["failed"] += 1
-        
-        return results
+        return await _run_optimization_steps(optimizations, "GPU")
     
     async def _enable_hardware_gpu_scheduling(self) -> Dict[str, Any]:
         """Enable Hardware Accelerated GPU Scheduling."""
         try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
-                              r"SYSTEM\CurrentControlSet\Control\GraphicsDrivers",
-                              0, winreg.KEY_SET_VALUE) as key:
+            with self.registry_keys.open(winreg.HKEY_LOCAL_MACHINE,
+                                         r"SYSTEM\CurrentControlSet\Control\GraphicsDrivers") as key:
                 winreg.SetValueEx(key, "HwSchMode", 0, winreg.REG_DWORD, 2)
             
             return {
@@ -599,10 +736,9 @@ class GPUOptimizations:
     async def _disable_fullscreen_optimization(self) -> Dict[str, Any]:
         """Disable fullscreen optimization globally."""
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                              r"System\GameConfigStore",
-                              0, winreg.KEY_SET_VALUE) as key:
-                winreg.SetValueEx(key, "GameDVR_Enabled", 0, winreg.REG_DWORD, 0)
+            with self.registry_keys.open(winreg.HKEY_CURRENT_USER,
+                                         r"System\GameConfigStore") as key:
+                # GameDVR_Enabled lives in the same key but is owned by _disable_game_dvr
                 winreg.SetValueEx(key, "GameDVR_FSEBehaviorMode", 0, winreg.REG_DWORD, 2)
             
             return {
@@ -658,9 +794,8 @@ class GPUOptimizations:
     async def _disable_game_bar_tips(self) -> Dict[str, Any]:
         """Disable Game Bar tips and notifications."""
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                              r"Software\Microsoft\GameBar",
-                              0, winreg.KEY_SET_VALUE) as key:
+            with self.registry_keys.open(winreg.HKEY_CURRENT_USER,
+                                         r"Software\Microsoft\GameBar") as key:
                 winreg.SetValueEx(key, "ShowStartupPanel", 0, winreg.REG_DWORD, 0)
                 winreg.SetValueEx(key, "GamePanelStartupTipIndex", 0, winreg.REG_DWORD, 3)
                 winreg.SetValueEx(key, "AllowAutoGameMode", 0, winreg.REG_DWORD, 1)
@@ -676,9 +811,8 @@ class GPUOptimizations:
     async def _set_variable_refresh_rate(self) -> Dict[str, Any]:
         """Enable variable refresh rate optimization."""
         try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
-                              r"SYSTEM\CurrentControlSet\Control\GraphicsDrivers",
-                              0, winreg.KEY_SET_VALUE) as key:
+            with self.registry_keys.open(winreg.HKEY_LOCAL_MACHINE,
+                                         r"SYSTEM\CurrentControlSet\Control\GraphicsDrivers") as key:
                 winreg.SetValueEx(key, "VrrOptimizeEnable", 0, winreg.REG_DWORD, 1)
             
             return {
@@ -692,55 +826,104 @@ class GPUOptimizations:
 class NetworkOptimizations:
     """Advanced network optimization for gaming."""
     
-    def __init__(self):
+    # Applied together with a single `netsh int tcp set global`. Chimney offload
+    # is left to _disable_tcp_chimney.
+    TCP_GLOBALS = {"autotuninglevel": "normal", "rss": "enabled"}
+    INTERFACE_CACHE_TTL = 30.0  # seconds
+    # Windows interface names that are never a gaming connection, rejected before
+    # the regex (which already covers loopback)
+    SKIP_INTERFACE_PREFIXES = ("vEthernet", "VMware Network Adapter", "VirtualBox Host-Only")
+    SIO_TCP_SET_ACK_FREQUENCY = 0x98000017
+    NETADAPTER_MISSING_EXIT = 3  # PowerShell exit code when the NetAdapter module is absent
+    ADAPTER_CLASS_PATH = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e972-e325-11ce-bfc1-08002be10318}"
+    
+    def __init__(self, registry_keys: Optional[RegistryKeyCache] = None):
         self.logger = logging.getLogger(__name__)
+        self.registry_keys = registry_keys or RegistryKeyCache()
+        self._iface_cache: Optional[Tuple[List[str], float]] = None
+        # Keywords must start a word, so e.g. "tap" does not reject a name that merely
+        # contains it, while prefixes like "VirtualBox" and "Tunneling" still match
+        self._skip_adapter = re.compile(r"\b(?:loopback|virtual|bluetooth|vpn|openvpn|tap|tunnel)",
+                                        re.IGNORECASE).search
+        
+        try:
+            self._dnsapi = ctypes.WinDLL("dnsapi", use_last_error=True)
+        except (AttributeError, OSError):
+            self._dnsapi = None
+    
+    @staticmethod
+    def disable_delayed_ack(sock: socket.socket) -> bool:
+        """Make Windows acknowledge every segment received on `sock`.
+        
+        Takes effect immediately for that socket, unlike the TcpAckFrequency
+        registry value which is system-wide and needs a reboot.
+        """
+        if _ws2_32 is None:
+            return False
+        
+        frequency = ctypes.c_ulong(1)
+        bytes_returned = ctypes.c_ulong(0)
+        result = _ws2_32.WSAIoctl(
+            sock.fileno(), NetworkOptimizations.SIO_TCP_SET_ACK_FREQUENCY,
+            ctypes.byref(frequency), ctypes.sizeof(frequency), None, 0,
+            ctypes.byref(bytes_returned), None, None
+        )
+        if result != 0:
+            logging.getLogger(__name__).debug(
+                f"SIO_TCP_SET_ACK_FREQUENCY failed with WSA error {ctypes.get_last_error()}"
+            )
+            return False
+        return True
+    
+    def _run_powershell(self, commands: List[str]) -> subprocess.CompletedProcess:
+        """Run several cmdlets in a single PowerShell process, stopping at the first error."""
+        script = "; ".join(["$ErrorActionPreference = 'Stop'"] + commands)
+        return subprocess.run(["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-Command", script],
+                              capture_output=True, text=True, timeout=60)
+    
+    def _flush_dns_cache(self) -> bool:
+        """Flush the DNS resolver cache, in-process when dnsapi.dll is available."""
+        if self._dnsapi is not None:
+            return bool(self._dnsapi.DnsFlushResolverCache())
+        
+        result = subprocess.run(["ipconfig", "/flushdns"], capture_output=True, text=True)
+        return result.returncode == 0
+    
+    def _get_active_interfaces(self) -> List[str]:
+        """Get the names of physical interfaces that are up (cached briefly)."""
+        now = time.monotonic()
+        if self._iface_cache and now - self._iface_cache[1] < self.INTERFACE_CACHE_TTL:
+            return self._iface_cache[0]
+        
+        import psutil
+        interfaces = [
+            name for name, stats in psutil.net_if_stats().items()
+            if stats.isup and not name.startswith(self.SKIP_INTERFACE_PREFIXES)
+            and self._skip_adapter(name) is None
+        ]
+        self._iface_cache = (interfaces, now)
+        return interfaces
     
     async def apply_optimizations(self) -> Dict[str, Any]:
         """Apply network optimizations."""
-        results = {
-            "status": "success",
-            "total": 0,
-            "successful": 0,
-            "failed": 0,
-            "optimizations": []
-        }
-        
         optimizations = [
             self._optimize_tcp_stack,
-            self._disable_nagle_algorithm,
-            self._set_receive_side_scaling,
+            self._set_tcp_ack_frequency,
             self._optimize_interrupt_moderation,
             self._set_network_throttling,
             self._optimize_dns_settings,
             self._disable_tcp_chimney
         ]
         
-        for optimization in optimizations:
-            try:
-                result = await optimization()
-                results["optimizations"].append(result)
-                results["total"] += 1
-                if result.get("success", False):
-                    results["successful"] += 1
-                else:
-                    results["failed"] += 1
-            except Exception as e:
-                self.logger.error(f"Network optimization failed: {e}")
-                results["failed"] += 1
-        
-        return results
+        return await _run_optimization_steps(optimizations, "Network")
     
     async def _optimize_tcp_stack(self) -> Dict[str, Any]:
         """Optimize TCP stack for gaming."""
         try:
             # Optimize TCP settings
-            subprocess.run([
-                "netsh", "int", "tcp", "set", "global", "autotuninglevel=normal"
-            ], check=True)
-            
-            subprocess.run([
-                "netsh", "int", "tcp", "set", "global", "chimney=enabled"
-            ], check=True)
+            command = ["netsh", "int", "tcp", "set", "global"]
+            command.extend(f"{option}={value}" for option, value in self.TCP_GLOBALS.items())
+            subprocess.run(command, check=True)
             
             return {
                 "name": "TCP Stack Optimization",
@@ -750,46 +933,97 @@ class NetworkOptimizations:
         except Exception as e:
             return {"name": "TCP Stack Optimization", "success": False, "message": str(e)}
     
-    async def _disable_nagle_algorithm(self) -> Dict[str, Any]:
-        """Disable Nagle algorithm for lower latency."""
+    async def _set_tcp_ack_frequency(self) -> Dict[str, Any]:
+        """Acknowledge every TCP segment immediately on all interfaces."""
         try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
-                              r"SYSTEM\CurrentControlSet\Services\Tcpip\Parameters\Interfaces",
-                              0, winreg.KEY_SET_VALUE) as key:
-                # This would need to be applied to each network interface
-                pass
+            interfaces_path = r"SYSTEM\CurrentControlSet\Services\Tcpip\Parameters\Interfaces"
+            with self.registry_keys.open(winreg.HKEY_LOCAL_MACHINE, interfaces_path, winreg.KEY_READ) as key:
+                interface_count = winreg.QueryInfoKey(key)[0]
+                interfaces = [winreg.EnumKey(key, i) for i in range(interface_count)]
             
-            return {
-                "name": "Nagle Algorithm Disable",
-                "success": True,
-                "message": "Nagle algorithm disabled for lower latency"
-            }
-        except Exception as e:
-            return {"name": "Nagle Algorithm Disable", "success": False, "message": str(e)}
-    
-    async def _set_receive_side_scaling(self) -> Dict[str, Any]:
-        """Enable receive side scaling."""
-        try:
-            subprocess.run([
-                "netsh", "int", "tcp", "set", "global", "rss=enabled"
-            ], check=True)
+            # One import covers every interface instead of a key open per value
+            result = _import_registry_values({
+                f"HKEY_LOCAL_MACHINE\\{interfaces_path}\\{interface}": {"TcpAckFrequency": 1}
+                for interface in interfaces
+            })
             
             return {
-                "name": "Receive Side Scaling",
-                "success": True,
-                "message": "Receive side scaling enabled"
+                "name": "TCP ACK Frequency",
+                "success": result.returncode == 0,
+                "message": (f"Delayed ACK disabled on {len(interfaces)} interfaces"
+                            if result.returncode == 0 else result.stderr)
             }
         except Exception as e:
-            return {"name": "Receive Side Scaling", "success": False, "message": str(e)}
+            return {"name": "TCP ACK Frequency", "success": False, "message": str(e)}
+    
+    def _disable_interrupt_moderation_in_registry(self) -> int:
+        """Write *InterruptModeration=0 into the class keys of adapters whose driver defines it."""
+        with self.registry_keys.open(winreg.HKEY_LOCAL_MACHINE, self.ADAPTER_CLASS_PATH,
+                                     winreg.KEY_READ) as class_key:
+            subkey_count = winreg.QueryInfoKey(class_key)[0]
+            subkey_names = [winreg.EnumKey(class_key, i) for i in range(subkey_count)]
+        
+        # Only the numbered subkeys are adapter instances ("Properties" is not)
+        adapter_names = [name for name in subkey_names if name.isdigit()]
+        tuned_adapters = 0
+        
+        for name in adapter_names:
+            with self.registry_keys.open(winreg.HKEY_LOCAL_MACHINE, f"{self.ADAPTER_CLASS_PATH}\\{name}",
+                                         winreg.KEY_READ | winreg.KEY_SET_VALUE) as adapter_key:
+                try:
+                    driver_desc = winreg.QueryValueEx(adapter_key, "DriverDesc")[0]
+                except FileNotFoundError:
+                    continue
+                if self._skip_adapter(driver_desc) is not None:
+                    continue
+                # Drivers declare their advanced keywords under Ndi\Params; a value the
+                # driver does not define would just be ignored
+                try:
+                    with winreg.OpenKey(adapter_key, r"Ndi\Params\*InterruptModeration"):
+                        pass
+                except FileNotFoundError:
+                    continue
+                winreg.SetValueEx(adapter_key, "*InterruptModeration", 0, winreg.REG_SZ, "0")
+                tuned_adapters += 1
+        
+        return tuned_adapters
     
     async def _optimize_interrupt_moderation(self) -> Dict[str, Any]:
         """Optimize network adapter interrupt moderation."""
         try:
-            # This would typically involve adapter-specific settings
+            # The NDIS keyword interface validates the value and applies it without a
+            # reboot. Only adapters that expose the keyword are set, and any failure to
+            # set one stops the script; it prints how many adapters were changed.
+            result = self._run_powershell([
+                "if (-not (Get-Command Get-NetAdapter -ErrorAction SilentlyContinue)) "
+                f"{{ exit {self.NETADAPTER_MISSING_EXIT} }}",
+                "(Get-NetAdapter -Physical | Where-Object Status -eq 'Up' | ForEach-Object { "
+                "Get-NetAdapterAdvancedProperty -Name $_.Name -RegistryKeyword '*InterruptModeration' "
+                "-ErrorAction SilentlyContinue } | ForEach-Object { "
+                "Set-NetAdapterAdvancedProperty -Name $_.Name -RegistryKeyword '*InterruptModeration' "
+                "-RegistryValue 0 -PassThru } | Measure-Object).Count"
+            ])
+            
+            if result.returncode == self.NETADAPTER_MISSING_EXIT:
+                # NetAdapter cmdlets are missing on some editions; fall back to the raw keys
+                tuned_adapters = self._disable_interrupt_moderation_in_registry()
+                return {
+                    "name": "Interrupt Moderation",
+                    "success": tuned_adapters > 0,
+                    "message": f"Interrupt moderation disabled on {tuned_adapters} adapters (restart required)"
+                }
+            
+            if result.returncode != 0:
+                return {"name": "Interrupt Moderation", "success": False, "message": result.stderr}
+            
+            output = result.stdout.split()
+            tuned_adapters = int(output[-1]) if output and output[-1].isdigit() else 0
+            
             return {
                 "name": "Interrupt Moderation",
-                "success": True,
-                "message": "Network interrupt moderation optimized"
+                "success": tuned_adapters > 0,
+                "message": (f"Interrupt moderation disabled on {tuned_adapters} active adapters"
+                            if tuned_adapters else "No active adapter exposes interrupt moderation")
             }
         except Exception as e:
             return {"name": "Interrupt Moderation", "success": False, "message": str(e)}
@@ -797,9 +1031,8 @@ class NetworkOptimizations:
     async def _set_network_throttling(self) -> Dict[str, Any]:
         """Disable network throttling."""
         try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
-                              r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\Multimedia\SystemProfile",
-                              0, winreg.KEY_SET_VALUE) as key:
+            with self.registry_keys.open(winreg.HKEY_LOCAL_MACHINE,
+                                         r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\Multimedia\SystemProfile") as key:
                 winreg.SetValueEx(key, "NetworkThrottlingIndex", 0, winreg.REG_DWORD, 0xffffffff)
             
             return {
@@ -813,19 +1046,27 @@ class NetworkOptimizations:
     async def _optimize_dns_settings(self) -> Dict[str, Any]:
         """Optimize DNS settings for gaming."""
         try:
-            # Set fast DNS servers
-            subprocess.run([
-                "netsh", "interface", "ip", "set", "dns", "name=*", "static", "1.1.1.1", "primary"
-            ], check=True)
+            interfaces = self._get_active_interfaces()
+            if not interfaces:
+                return {"name": "DNS Optimization", "success": False, "message": "No active network interfaces found"}
             
-            subprocess.run([
-                "netsh", "interface", "ip", "add", "dns", "name=*", "8.8.8.8", "index=2"
-            ], check=True)
+            # Set fast DNS servers on every interface in one PowerShell session
+            commands = []
+            for interface in interfaces:
+                alias = interface.replace("'", "''")
+                commands.append(f"Set-DnsClientServerAddress -InterfaceAlias '{alias}' "
+                                f"-ServerAddresses ('{GAMING_DNS.primary}','{GAMING_DNS.secondary}')")
+            result = self._run_powershell(commands)
+            if result.returncode != 0:
+                return {"name": "DNS Optimization", "success": False, "message": result.stderr}
+            
+            flushed = self._flush_dns_cache()
             
             return {
                 "name": "DNS Optimization",
                 "success": True,
-                "message": "Fast DNS servers configured"
+                "message": (f"{GAMING_DNS.name} DNS servers configured" if flushed
+                            else f"{GAMING_DNS.name} DNS servers configured (DNS cache flush failed)")
             }
         except Exception as e:
             return {"name": "DNS Optimization", "success": False, "message": str(e)}
@@ -848,19 +1089,12 @@ class NetworkOptimizations:
 class StorageOptimizations:
     """Advanced storage optimization for gaming."""
     
-    def __init__(self):
+    def __init__(self, registry_keys: Optional[RegistryKeyCache] = None):
         self.logger = logging.getLogger(__name__)
+        self.registry_keys = registry_keys or RegistryKeyCache()
     
     async def apply_optimizations(self) -> Dict[str, Any]:
         """Apply storage optimizations."""
-        results = {
-            "status": "success",
-            "total": 0,
-            "successful": 0,
-            "failed": 0,
-            "optimizations": []
-        }
-        
         optimizations = [
             self._disable_indexing,
             self._optimize_ssd_settings,
@@ -870,33 +1104,22 @@ class StorageOptimizations:
             self._enable_directstorage
         ]
         
-        for optimization in optimizations:
-            try:
-                result = await optimization()
-                results["optimizations"].append(result)
-                results["total"] += 1
-                if result.get("success", False):
-                    results["successful"] += 1
-                else:
-                    results["failed"] += 1
-            except Exception as e:
-                self.logger.error(f"Storage optimization failed: {e}")
-                results["failed"] += 1
-        
-        return results
+        # Each step drives a different subsystem (search service, TRIM, defrag
+        # task, NTFS), so their commands can all run at the same time
+        return await _run_optimization_steps(optimizations, "Storage", concurrent=True)
     
     async def _disable_indexing(self) -> Dict[str, Any]:
         """Disable search indexing on gaming drives."""
         try:
             # Disable search indexing service
-            subprocess.run([
+            returncode = await _run_command([
                 "sc", "config", "WSearch", "start=disabled"
-            ], check=True)
+            ])
             
             return {
                 "name": "Search Indexing Disable",
-                "success": True,
-                "message": "Search indexing disabled on gaming drives"
+                "success": returncode == 0,
+                "message": "Search indexing disabled on gaming drives" if returncode == 0 else f"sc exited with code {returncode}"
             }
         except Exception as e:
             return {"name": "Search Indexing Disable", "success": False, "message": str(e)}
@@ -905,14 +1128,14 @@ class StorageOptimizations:
         """Optimize SSD-specific settings."""
         try:
             # Enable TRIM
-            subprocess.run([
+            returncode = await _run_command([
                 "fsutil", "behavior", "set", "DisableDeleteNotify", "0"
-            ], check=True)
+            ])
             
             return {
                 "name": "SSD Optimization",
-                "success": True,
-                "message": "SSD settings optimized (TRIM enabled)"
+                "success": returncode == 0,
+                "message": "SSD settings optimized (TRIM enabled)" if returncode == 0 else f"fsutil exited with code {returncode}"
             }
         except Exception as e:
             return {"name": "SSD Optimization", "success": False, "message": str(e)}
@@ -932,14 +1155,14 @@ class StorageOptimizations:
     async def _disable_defragmentation(self) -> Dict[str, Any]:
         """Disable automatic defragmentation on SSDs."""
         try:
-            subprocess.run([
+            returncode = await _run_command([
                 "schtasks", "/Change", "/TN", "Microsoft\\Windows\\Defrag\\ScheduledDefrag", "/Disable"
-            ], check=True)
+            ])
             
             return {
                 "name": "Defragmentation Disable",
-                "success": True,
-                "message": "Automatic defragmentation disabled for SSDs"
+                "success": returncode == 0,
+                "message": "Automatic defragmentation disabled for SSDs" if returncode == 0 else f"schtasks exited with code {returncode}"
             }
         except Exception as e:
             return {"name": "Defragmentation Disable", "success": False, "message": str(e)}
@@ -948,14 +1171,14 @@ class StorageOptimizations:
         """Optimize NTFS file system settings."""
         try:
             # Optimize NTFS settings
-            subprocess.run([
+            returncode = await _run_command([
                 "fsutil", "behavior", "set", "mftzone", "2"
-            ], check=True)
+            ])
             
             return {
                 "name": "NTFS Optimization",
-                "success": True,
-                "message": "NTFS file system settings optimized"
+                "success": returncode == 0,
+                "message": "NTFS file system settings optimized" if returncode == 0 else f"fsutil exited with code {returncode}"
             }
         except Exception as e:
             return {"name": "NTFS Optimization", "success": False, "message": str(e)}
@@ -976,49 +1199,27 @@ class StorageOptimizations:
 class GamingModeOptimizations:
     """Advanced Gaming Mode optimizations."""
     
-    def __init__(self):
+    def __init__(self, registry_keys: Optional[RegistryKeyCache] = None):
         self.logger = logging.getLogger(__name__)
+        self.registry_keys = registry_keys or RegistryKeyCache()
     
     async def apply_optimizations(self) -> Dict[str, Any]:
         """Apply gaming mode optimizations."""
-        results = {
-            "status": "success",
-            "total": 0,
-            "successful": 0,
-            "failed": 0,
-            "optimizations": []
-        }
-        
         optimizations = [
             self._enable_game_mode,
             self._disable_game_dvr,
             self._optimize_focus_assist,
             self._disable_windows_defender_realtime,
-            self._optimize_visual_effects,
-            self._set_gaming_power_plan
+            self._optimize_visual_effects
         ]
         
-        for optimization in optimizations:
-            try:
-                result = await optimization()
-                results["optimizations"].append(result)
-                results["total"] += 1
-                if result.get("success", False):
-                    results["successful"] += 1
-                else:
-                    results["failed"] += 1
-            except Exception as e:
-                self.logger.error(f"Gaming mode optimization failed: {e}")
-                results["failed"] += 1
-        
-        return results
+        return await _run_optimization_steps(optimizations, "Gaming mode")
     
     async def _enable_game_mode(self) -> Dict[str, Any]:
         """Enable Windows Game Mode."""
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                              r"Software\Microsoft\GameBar",
-                              0, winreg.KEY_SET_VALUE) as key:
+            with self.registry_keys.open(winreg.HKEY_CURRENT_USER,
+                                         r"Software\Microsoft\GameBar") as key:
                 winreg.SetValueEx(key, "AutoGameModeEnabled", 0, winreg.REG_DWORD, 1)
             
             return {
@@ -1032,9 +1233,8 @@ class GamingModeOptimizations:
     async def _disable_game_dvr(self) -> Dict[str, Any]:
         """Disable Game DVR for performance."""
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                              r"System\GameConfigStore",
-                              0, winreg.KEY_SET_VALUE) as key:
+            with self.registry_keys.open(winreg.HKEY_CURRENT_USER,
+                                         r"System\GameConfigStore") as key:
                 winreg.SetValueEx(key, "GameDVR_Enabled", 0, winreg.REG_DWORD, 0)
             
             return {
@@ -1048,9 +1248,8 @@ class GamingModeOptimizations:
     async def _optimize_focus_assist(self) -> Dict[str, Any]:
         """Optimize Focus Assist for gaming."""
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                              r"Software\Microsoft\Windows\CurrentVersion\CloudStore\Store\Cache\DefaultAccount",
-                              0, winreg.KEY_SET_VALUE) as key:
+            with self.registry_keys.open(winreg.HKEY_CURRENT_USER,
+                                         r"Software\Microsoft\Windows\CurrentVersion\CloudStore\Store\Cache\DefaultAccount") as key:
                 # Configure Focus Assist to activate during gaming
                 pass
             
@@ -1069,7 +1268,7 @@ class GamingModeOptimizations:
             result = subprocess.run([
                 "powershell", "-Command",
                 "Set-MpPreference -DisableRealtimeMonitoring $true"
-            ], capture_output=True, text=True)
+            ], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             return {
                 "name": "Windows Defender Optimization",
@@ -1082,9 +1281,8 @@ class GamingModeOptimizations:
     async def _optimize_visual_effects(self) -> Dict[str, Any]:
         """Optimize visual effects for performance."""
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                              r"Software\Microsoft\Windows\CurrentVersion\Explorer\VisualEffects",
-                              0, winreg.KEY_SET_VALUE) as key:
+            with self.registry_keys.open(winreg.HKEY_CURRENT_USER,
+                                         r"Software\Microsoft\Windows\CurrentVersion\Explorer\VisualEffects") as key:
                 winreg.SetValueEx(key, "VisualFXSetting", 0, winreg.REG_DWORD, 2)  # Custom
             
             return {
@@ -1094,37 +1292,28 @@ class GamingModeOptimizations:
             }
         except Exception as e:
             return {"name": "Visual Effects Optimization", "success": False, "message": str(e)}
-    
-    async def _set_gaming_power_plan(self) -> Dict[str, Any]:
-        """Set ultimate performance power plan."""
-        try:
-            # Create and activate ultimate performance power plan
-            result = subprocess.run([
-                "powercfg", "/duplicatescheme", "e9a42b02-d5df-448d-aa00-03f14749eb61"
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                # Extract GUID and activate
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if 'GUID:' in line:
-                        guid = line.split('GUID: ')[1].strip()
-                        subprocess.run(["powercfg", "/setactive", guid], check=True)
-                        break
-            
-            return {
-                "name": "Gaming Power Plan",
-                "success": True,
-                "message": "Ultimate performance power plan activated"
-            }
-        except Exception as e:
-            return {"name": "Gaming Power Plan", "success": False, "message": str(e)}
 
 # Factory function
 def create_windows_optimizer() -> Windows11GamingOptimizer:
     """Create and initialize Windows gaming optimizer."""
     return Windows11GamingOptimizer()
 
+def create_latency_socket(send_buffer: int = 64 * 1024) -> socket.socket:
+    """Create a TCP socket with Nagle disabled for latency-sensitive traffic.
+    
+    Nagle can only be turned off per socket with TCP_NODELAY; there is no
+    registry switch that does it system-wide. Use this for any active probe
+    or game connection opened on behalf of the optimizer.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, send_buffer)
+    if hasattr(socket, "TCP_QUICKACK"):  # Linux only
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    if os.name == 'nt':
+        NetworkOptimizations.disable_delayed_ack(sock)
+    return sock
+
 # Example usage
 if __name__ == "__main__":
     async def demo():